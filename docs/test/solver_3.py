@@ -47,28 +47,33 @@ solver.print_stats()
 from libUnderworld import petsc
 petsc.OptionsPrint()
 
-if 5 != stats.pressure_its:
-    raise RuntimeError("Test returned wrong number of pressure iterations: should be 3")
-if 9 != stats.velocity_presolve_its:
-    raise RuntimeError("Test returned wrong number of velocity pre solve iterations: should be 6")
-if -1 != stats.velocity_pressuresolve_its:  # -1 will be returned if this stat isn't supported.
-    if 35 != stats.velocity_pressuresolve_its:
-        raise RuntimeError("Test returned wrong number of velocity pressure solve iterations: should be 15")
-if 7 != stats.velocity_backsolve_its:
-    raise RuntimeError("Test returned wrong number of velocity back solve iterations: should be 6")
+def check_stats(stats, checks):
+    """
+    Raises a RuntimeError if any of the (expected, attr, message) checks
+    does not match the corresponding solver stat.
+    """
+    for expected, attr, message in checks:
+        got = getattr(stats, attr)
+        # -1 will be returned if the pressure solve stat isn't supported.
+        if attr == "velocity_pressuresolve_its" and got == -1:
+            continue
+        if expected != got:
+            raise RuntimeError("Test returned wrong number of {}: should be {}, got {}".format(message, expected, got))
+
+check_stats(stats, [ ( 5, "pressure_its",               "pressure iterations"),
+                     ( 9, "velocity_presolve_its",      "velocity pre solve iterations"),
+                     (35, "velocity_pressuresolve_its", "velocity pressure solve iterations"),
+                     ( 7, "velocity_backsolve_its",     "velocity back solve iterations") ])
 
 solver.set_inner_method("lu")
 solver.solve()
 solver.set_inner_method("mg")
 solver.solve()
+stats=solver.get_stats()
 solver.print_stats()
 petsc.OptionsPrint()
-if 5 != stats.pressure_its:
-    raise RuntimeError("Test returned wrong number of pressure iterations: should be 3")
-if 7 != stats.velocity_presolve_its:
-    raise RuntimeError("Test returned wrong number of velocity pre solve iterations: should be 6")
-if -1 != stats.velocity_pressuresolve_its:  # -1 will be returned if this stat isn't supported.
-    if 27 != stats.velocity_pressuresolve_its:
-        raise RuntimeError("Test returned wrong number of velocity pressure solve iterations: should be 15")
-if 6 != stats.velocity_backsolve_its:
-    raise RuntimeError("Test returned wrong number of velocity back solve iterations: should be 6")
+
+check_stats(stats, [ ( 5, "pressure_its",               "pressure iterations"),
+                     ( 7, "velocity_presolve_its",      "velocity pre solve iterations"),
+                     (27, "velocity_pressuresolve_its", "velocity pressure solve iterations"),
+                     ( 6, "velocity_backsolve_its",     "velocity back solve iterations") ])